@@ -4,28 +4,156 @@ Admin Panel for Airline Game
 Runs on port 9001
 """
 
-from flask import Flask, render_template, jsonify, request
-import mysql.connector
+from flask import Flask, render_template, jsonify, request, Response, stream_with_context
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
+import orjson
+from mysql.connector import pooling
 from datetime import datetime, timedelta
+from decimal import Decimal
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import os
 import psutil
 import platform
-import random
+import re
+import tempfile
+import threading
+import time
+
+def _json_default(obj):
+    """Serialize types orjson does not handle natively"""
+    if isinstance(obj, Decimal):
+        # Same as Flask's default provider, keeps DECIMAL columns exact
+        return str(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, used by jsonify() and app.json"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NAIVE_UTC).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_json_default, option=orjson.OPT_NAIVE_UTC),
+            mimetype='application/json'
+        )
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Short-lived response cache for dashboard endpoints. Game data only changes
+# once per cycle, so a few seconds of staleness is fine. Use CACHE_TYPE=RedisCache
+# (with CACHE_REDIS_URL) when running several workers so they share one cache.
+CACHE_TIMEOUT = int(os.getenv('CACHE_TIMEOUT', 15))
+cache = Cache(app, config={
+    'CACHE_TYPE': os.getenv('CACHE_TYPE', 'SimpleCache'),
+    'CACHE_REDIS_URL': os.getenv('CACHE_REDIS_URL'),
+    'CACHE_DEFAULT_TIMEOUT': CACHE_TIMEOUT
+})
+
+def is_cacheable(rv):
+    """Only cache successful responses; errors are returned as (response, status) tuples"""
+    return not isinstance(rv, tuple)
 
 # Database configuration from environment variables
+# DB_HOST is "host" or "host:port"
+_db_host, _, _db_port = os.getenv('DB_HOST', 'localhost:3306').partition(':')
 DB_CONFIG = {
-    'host': os.getenv('DB_HOST', 'localhost').split(':')[0],
-    'port': int(os.getenv('DB_HOST', 'localhost:3306').split(':')[1]) if ':' in os.getenv('DB_HOST', 'localhost:3306') else 3306,
+    'host': _db_host,
+    'port': int(_db_port) if _db_port else 3306,
     'database': os.getenv('DB_NAME', 'airline'),
     'user': os.getenv('DB_USER', 'mfc01'),
     'password': os.getenv('DB_PASSWORD', 'ghEtmwBdnXYBQH4')
 }
 
+# Connection pool shared by all requests. close() on a pooled connection hands it
+# back to the pool instead of tearing down the socket. mysql-connector caps
+# pool_size at 32.
+DB_POOL_SIZE = min(int(os.getenv('DB_POOL_SIZE', 16)), 32)
+
+POOL = None
+_pool_lock = threading.Lock()
+
+def get_pool():
+    """Get the connection pool, creating it on first use"""
+    global POOL
+    if POOL is None:
+        with _pool_lock:
+            if POOL is None:
+                # Connections are reset when returned (conn.close()), so autocommit,
+                # temporary tables and open transactions left by the admin reset
+                # endpoints never leak into the next request
+                POOL = pooling.MySQLConnectionPool(
+                    pool_name='admin',
+                    pool_size=DB_POOL_SIZE,
+                    pool_reset_session=True,
+                    **DB_CONFIG
+                )
+    return POOL
+
+# Seconds to wait for a free pooled connection before giving up
+DB_POOL_TIMEOUT = 5
+
 def get_db_connection():
-    """Get database connection"""
-    return mysql.connector.connect(**DB_CONFIG)
+    """Get database connection from the pool, waiting briefly if all are in use"""
+    pool = get_pool()
+    deadline = time.monotonic() + DB_POOL_TIMEOUT
+    while True:
+        try:
+            return pool.get_connection()
+        except pooling.PoolError:
+            # The connector raises instead of blocking when the pool is exhausted
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.05)
+
+def fetch_all(query, params=()):
+    """Run a query on its own pooled connection and return all rows as dicts"""
+    conn = get_db_connection()
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute(query, params)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+        conn.close()
+
+def fetch_concurrently(*queries):
+    """Run independent queries in parallel on separate pooled connections, results in order"""
+    with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+        futures = [executor.submit(fetch_all, query) for query in queries]
+        return [future.result() for future in futures]
+
+def execute_script(cursor, statements, params=()):
+    """Run several statements in one round trip, returning each statement's row count"""
+    results = cursor.execute(';\n'.join(statements), params, multi=True)
+    return dict(zip(statements, (result.rowcount for result in results)))
+
+# Latest CPU/memory/disk readings, refreshed by a background thread so that
+# requests never block on psutil.cpu_percent(interval=1)
+RESOURCE_SAMPLE_INTERVAL = 1
+
+psutil.cpu_percent(interval=None)  # first non-blocking call always returns 0.0
+_CPU = 0.0
+_MEM = psutil.virtual_memory()
+_DISK = psutil.disk_usage('/')
+
+def _sample_resources():
+    """Refresh the resource readings every RESOURCE_SAMPLE_INTERVAL seconds"""
+    global _CPU, _MEM, _DISK
+    while True:
+        time.sleep(RESOURCE_SAMPLE_INTERVAL)
+        _CPU = psutil.cpu_percent(interval=None)
+        _MEM = psutil.virtual_memory()
+        _DISK = psutil.disk_usage('/')
+
+threading.Thread(target=_sample_resources, name='resource-sampler', daemon=True).start()
 
 @app.route('/')
 def index():
@@ -33,59 +161,136 @@ def index():
     return render_template('dashboard.html')
 
 @app.route('/api/stats')
+@cache.cached(timeout=CACHE_TIMEOUT, query_string=True, response_filter=is_cacheable)
 def get_stats():
     """Get overall statistics"""
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    
-    try:
-        # Total users
-        cursor.execute("SELECT COUNT(*) as total FROM user")
-        total_users = cursor.fetchone()['total']
-        
-        # Active users (last 7 days)
-        cursor.execute("""
-            SELECT COUNT(*) as active 
-            FROM user 
-            WHERE last_active >= DATE_SUB(NOW(), INTERVAL 7 DAY)
-        """)
-        active_users = cursor.fetchone()['active']
-        
-        # New users (last 30 days)
-        cursor.execute("""
-            SELECT COUNT(*) as new_users 
-            FROM user 
-            WHERE creation_time >= DATE_SUB(NOW(), INTERVAL 30 DAY)
-        """)
-        new_users = cursor.fetchone()['new_users']
-        
+    counts, status_breakdown, top_users = fetch_concurrently(
+        # Total, active (last 7 days) and new (last 30 days) users
+        """
+            SELECT 
+                (SELECT COUNT(*) FROM user) as total_users,
+                (SELECT COUNT(*) 
+                 FROM user 
+                 WHERE last_active >= DATE_SUB(NOW(), INTERVAL 7 DAY)) as active_users,
+                (SELECT COUNT(*) 
+                 FROM user 
+                 WHERE creation_time >= DATE_SUB(NOW(), INTERVAL 30 DAY)) as new_users
+        """,
         # User status breakdown
-        cursor.execute("""
+        """
             SELECT status, COUNT(*) as count 
             FROM user 
             GROUP BY status
-        """)
-        status_breakdown = cursor.fetchall()
-        
+        """,
         # Top users by level
-        cursor.execute("""
+        """
             SELECT user_name, email, level, status, last_active
             FROM user
             ORDER BY level DESC
             LIMIT 10
-        """)
-        top_users = cursor.fetchall()
-        
-        return jsonify({
-            'total_users': total_users,
-            'active_users': active_users,
-            'new_users': new_users,
-            'status_breakdown': status_breakdown,
-            'top_users': top_users
-        })
-    finally:
-        cursor.close()
-        conn.close()
+        """
+    )
+    
+    return jsonify({
+        'total_users': counts[0]['total_users'],
+        'active_users': counts[0]['active_users'],
+        'new_users': counts[0]['new_users'],
+        'status_breakdown': status_breakdown,
+        'top_users': top_users
+    })
+
+# innodb_ft_min_token_size if the ft_user_name_email FULLTEXT index exists, False if not.
+# Probed once per process, see get_user_fulltext().
+_USER_FULLTEXT = None
+
+# InnoDB's built-in FULLTEXT stopwords, used when the server's active list can't be read
+# (information_schema.INNODB_FT_DEFAULT_STOPWORD requires the PROCESS privilege)
+INNODB_DEFAULT_STOPWORDS = frozenset((
+    'a', 'about', 'an', 'are', 'as', 'at', 'be', 'by', 'com', 'de', 'en', 'for',
+    'from', 'how', 'i', 'in', 'is', 'it', 'la', 'of', 'on', 'or', 'that', 'the',
+    'this', 'to', 'was', 'what', 'when', 'where', 'who', 'will', 'with', 'und',
+    'www',
+))
+
+def _load_fulltext_stopwords(cursor, enabled, server_table):
+    """Get the stopwords InnoDB leaves out of FULLTEXT indexes"""
+    if not enabled:
+        return frozenset()
+    try:
+        if server_table:
+            # Configured as 'db_name/table_name'
+            db_name, _, table_name = server_table.partition('/')
+            cursor.execute(f"SELECT value FROM `{db_name}`.`{table_name}`")
+        else:
+            cursor.execute("SELECT value FROM information_schema.INNODB_FT_DEFAULT_STOPWORD")
+        return frozenset(row['value'].lower() for row in cursor.fetchall())
+    except Exception:
+        return INNODB_DEFAULT_STOPWORDS
+
+def get_user_fulltext(cursor):
+    """Get (min token size, stopwords) of the FULLTEXT user search index, or False without the index"""
+    global _USER_FULLTEXT
+    if _USER_FULLTEXT is None:
+        cursor.execute("""
+            SELECT 
+                @@innodb_ft_min_token_size as min_token_size,
+                @@innodb_ft_enable_stopword as enable_stopword,
+                @@innodb_ft_server_stopword_table as stopword_table,
+                EXISTS(
+                    SELECT 1 FROM information_schema.STATISTICS
+                    WHERE table_schema = %s AND table_name = 'user' AND index_name = 'ft_user_name_email'
+                ) as has_index
+        """, (DB_CONFIG['database'],))
+        result = cursor.fetchone()
+        if result['has_index']:
+            stopwords = _load_fulltext_stopwords(cursor, result['enable_stopword'], result['stopword_table'])
+            _USER_FULLTEXT = (result['min_token_size'], stopwords)
+        else:
+            _USER_FULLTEXT = False
+    return _USER_FULLTEXT
+
+# User list statements, one fixed (count, page) pair per search mode
+_USERS_COUNT_SQL = "SELECT COUNT(*) as total FROM user u {where_clause}"
+_USERS_PAGE_SQL = """
+    SELECT 
+        u.id,
+        u.user_name,
+        u.email,
+        u.status,
+        u.admin_status,
+        u.level,
+        DATE_FORMAT(u.creation_time, '%Y-%m-%dT%H:%i:%S') as creation_time,
+        DATE_FORMAT(u.last_active, '%Y-%m-%dT%H:%i:%S') as last_active
+    FROM user u
+    {where_clause}
+    ORDER BY u.last_active DESC
+    LIMIT %s OFFSET %s
+"""
+
+def _users_sql(where_clause):
+    """Build the (count, page) statements for a user list WHERE clause"""
+    return (_USERS_COUNT_SQL.format(where_clause=where_clause),
+            _USERS_PAGE_SQL.format(where_clause=where_clause))
+
+_USERS_ALL_SQL = _users_sql("")
+_USERS_FULLTEXT_SQL = _users_sql("WHERE MATCH(u.user_name, u.email) AGAINST (%s IN BOOLEAN MODE)")
+_USERS_LIKE_SQL = _users_sql("WHERE u.user_name LIKE %s OR u.email LIKE %s")
+
+def build_user_search(cursor, search):
+    """Pick the (count, page) statements and params matching search against user name and email"""
+    # FULLTEXT prefix match on every word; words below the minimum token size and
+    # stopwords are not indexed, so those searches (or a missing index) fall back to a LIKE scan
+    fulltext = get_user_fulltext(cursor)
+    words = re.findall(r'\w+', search)
+    if fulltext and words:
+        min_token_size, stopwords = fulltext
+        if all(len(word) >= min_token_size and word.lower() not in stopwords for word in words):
+            return _USERS_FULLTEXT_SQL, [' '.join(f'+{word}*' for word in words)]
+    return users_like_search(search)
+
+def users_like_search(search):
+    """The (count, page) statements and params for a substring match on user name and email"""
+    return _USERS_LIKE_SQL, [f'%{search}%', f'%{search}%']
 
 @app.route('/api/users')
 def get_users():
@@ -100,47 +305,42 @@ def get_users():
     try:
         offset = (page - 1) * per_page
         
-        # Build query
-        where_clause = ""
-        params = []
         if search:
-            where_clause = "WHERE u.user_name LIKE %s OR u.email LIKE %s"
-            params = [f'%{search}%', f'%{search}%']
+            statements, params = build_user_search(cursor, search)
+        else:
+            statements, params = _USERS_ALL_SQL, []
         
         # Get total count
-        count_query = f"SELECT COUNT(*) as total FROM user u {where_clause}"
-        cursor.execute(count_query, params)
+        cursor.execute(statements[0], params)
         total = cursor.fetchone()['total']
         
-        # Get users with airline info
-        query = f"""
-            SELECT 
-                u.id,
-                u.user_name,
-                u.email,
-                u.status,
-                u.admin_status,
-                u.level,
-                u.creation_time,
-                u.last_active,
-                GROUP_CONCAT(a.name) as airlines
-            FROM user u
-            LEFT JOIN user_airline ua ON u.user_name = ua.user_name
-            LEFT JOIN airline a ON ua.airline = a.id
-            {where_clause}
-            GROUP BY u.id
-            ORDER BY u.last_active DESC
-            LIMIT %s OFFSET %s
-        """
-        cursor.execute(query, params + [per_page, offset])
+        if total == 0 and statements is _USERS_FULLTEXT_SQL:
+            # FULLTEXT only matches word prefixes, so retry as the substring match
+            # (e.g. "smith" in "johnsmith")
+            statements, params = users_like_search(search)
+            cursor.execute(statements[0], params)
+            total = cursor.fetchone()['total']
+        
+        # Get the page of users
+        cursor.execute(statements[1], params + [per_page, offset])
         users = cursor.fetchall()
         
-        # Convert datetime to string
+        # Get airline names for just the users on this page
+        airlines_by_user = defaultdict(list)
+        if users:
+            user_names = [user['user_name'] for user in users]
+            placeholders = ','.join(['%s'] * len(user_names))
+            cursor.execute(f"""
+                SELECT ua.user_name, a.name
+                FROM user_airline ua
+                JOIN airline a ON ua.airline = a.id
+                WHERE ua.user_name IN ({placeholders})
+            """, user_names)
+            for row in cursor.fetchall():
+                airlines_by_user[row['user_name']].append(row['name'])
+        
         for user in users:
-            if user['creation_time']:
-                user['creation_time'] = user['creation_time'].isoformat()
-            if user['last_active']:
-                user['last_active'] = user['last_active'].isoformat()
+            user['airlines'] = ','.join(airlines_by_user[user['user_name']]) or None
         
         return jsonify({
             'users': users,
@@ -163,7 +363,14 @@ def get_user_details(user_id):
         # Get user info
         cursor.execute("""
             SELECT 
-                u.*,
+                u.id,
+                u.user_name,
+                u.email,
+                u.status,
+                u.admin_status,
+                u.level,
+                DATE_FORMAT(u.creation_time, '%Y-%m-%dT%H:%i:%S') as creation_time,
+                DATE_FORMAT(u.last_active, '%Y-%m-%dT%H:%i:%S') as last_active,
                 GROUP_CONCAT(DISTINCT a.id) as airline_ids,
                 GROUP_CONCAT(DISTINCT a.name) as airline_names
             FROM user u
@@ -177,15 +384,9 @@ def get_user_details(user_id):
         if not user:
             return jsonify({'error': 'User not found'}), 404
         
-        # Convert datetime to string
-        if user['creation_time']:
-            user['creation_time'] = user['creation_time'].isoformat()
-        if user['last_active']:
-            user['last_active'] = user['last_active'].isoformat()
-        
         # Get IP addresses
         cursor.execute("""
-            SELECT ip, occurrence, last_update
+            SELECT ip, occurrence, DATE_FORMAT(last_update, '%Y-%m-%dT%H:%i:%S') as last_update
             FROM user_ip
             WHERE user = %s
             ORDER BY last_update DESC
@@ -193,10 +394,6 @@ def get_user_details(user_id):
         """, (user_id,))
         ips = cursor.fetchall()
         
-        for ip in ips:
-            if ip['last_update']:
-                ip['last_update'] = ip['last_update'].isoformat()
-        
         # Get user modifiers
         cursor.execute("""
             SELECT modifier_name, creation
@@ -207,7 +404,7 @@ def get_user_details(user_id):
         
         # Get UUIDs
         cursor.execute("""
-            SELECT uuid, occurrence, last_update
+            SELECT uuid, occurrence, DATE_FORMAT(last_update, '%Y-%m-%dT%H:%i:%S') as last_update
             FROM user_uuid
             WHERE user = %s
             ORDER BY last_update DESC
@@ -215,10 +412,6 @@ def get_user_details(user_id):
         """, (user_id,))
         uuids = cursor.fetchall()
         
-        for uuid in uuids:
-            if uuid['last_update']:
-                uuid['last_update'] = uuid['last_update'].isoformat()
-        
         return jsonify({
             'user': user,
             'ips': ips,
@@ -244,7 +437,7 @@ def get_users_by_ip(ip_address):
                 u.status,
                 u.level,
                 ui.occurrence,
-                ui.last_update,
+                DATE_FORMAT(ui.last_update, '%Y-%m-%dT%H:%i:%S') as last_update,
                 GROUP_CONCAT(DISTINCT a.name) as airlines
             FROM user_ip ui
             JOIN user u ON ui.user = u.id
@@ -256,16 +449,13 @@ def get_users_by_ip(ip_address):
         """, (ip_address,))
         users = cursor.fetchall()
         
-        for user in users:
-            if user['last_update']:
-                user['last_update'] = user['last_update'].isoformat()
-        
         return jsonify({'users': users, 'ip': ip_address})
     finally:
         cursor.close()
         conn.close()
 
 @app.route('/api/activity')
+@cache.cached(timeout=CACHE_TIMEOUT, query_string=True, response_filter=is_cacheable)
 def get_activity():
     """Get recent user activity"""
     days = int(request.args.get('days', 7))
@@ -276,7 +466,7 @@ def get_activity():
     try:
         cursor.execute("""
             SELECT 
-                DATE(last_active) as date,
+                DATE_FORMAT(DATE(last_active), '%Y-%m-%d') as date,
                 COUNT(DISTINCT id) as active_users
             FROM user
             WHERE last_active >= DATE_SUB(NOW(), INTERVAL %s DAY)
@@ -285,10 +475,6 @@ def get_activity():
         """, (days,))
         activity = cursor.fetchall()
         
-        for row in activity:
-            if row['date']:
-                row['date'] = row['date'].isoformat()
-        
         return jsonify({'activity': activity})
     finally:
         cursor.close()
@@ -299,18 +485,18 @@ def get_server_resources():
     """Get server resource usage (CPU, RAM, Disk)"""
     try:
         # CPU usage
-        cpu_percent = psutil.cpu_percent(interval=1)
+        cpu_percent = _CPU
         cpu_count = psutil.cpu_count()
         cpu_freq = psutil.cpu_freq()
         
         # Memory usage
-        memory = psutil.virtual_memory()
+        memory = _MEM
         memory_total = memory.total / (1024 ** 3)  # GB
         memory_used = memory.used / (1024 ** 3)    # GB
         memory_percent = memory.percent
         
         # Disk usage
-        disk = psutil.disk_usage('/')
+        disk = _DISK
         disk_total = disk.total / (1024 ** 3)  # GB
         disk_used = disk.used / (1024 ** 3)    # GB
         disk_percent = disk.percent
@@ -371,70 +557,40 @@ def get_server_resources():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/database/stats')
+@cache.cached(timeout=CACHE_TIMEOUT, query_string=True, response_filter=is_cacheable)
 def get_database_stats():
     """Get database statistics"""
     conn = get_db_connection()
     cursor = conn.cursor(dictionary=True)
     
     try:
-        stats = {}
-        
-        # Total airlines
-        cursor.execute("SELECT COUNT(*) as count FROM airline")
-        stats['total_airlines'] = cursor.fetchone()['count']
-        
-        # Active airlines (with balance > 0) - balance is in airline_info table
-        cursor.execute("""
-            SELECT COUNT(*) as count 
-            FROM airline a
-            JOIN airline_info ai ON a.id = ai.airline
-            WHERE CAST(ai.balance AS SIGNED) > 0
-        """)
-        stats['active_airlines'] = cursor.fetchone()['count']
-        
-        # Bot airlines
-        cursor.execute("SELECT COUNT(*) as count FROM airline WHERE airline_type = 2")
-        stats['bot_airlines'] = cursor.fetchone()['count']
-        
-        # Total airports
-        cursor.execute("SELECT COUNT(*) as count FROM airport")
-        stats['total_airports'] = cursor.fetchone()['count']
-        
-        # Total links/routes
-        cursor.execute("SELECT COUNT(*) as count FROM link")
-        stats['total_links'] = cursor.fetchone()['count']
-        
-        # Total airplanes
-        cursor.execute("SELECT COUNT(*) as count FROM airplane")
-        stats['total_airplanes'] = cursor.fetchone()['count']
-        
-        # In-flight airplanes
-        cursor.execute("SELECT COUNT(*) as count FROM airplane WHERE is_sold = 0")
-        stats['active_airplanes'] = cursor.fetchone()['count']
-        
-        # Database size
+        # All counters in a single round trip, one scalar subquery per column
         cursor.execute("""
             SELECT 
-                ROUND(SUM(data_length + index_length) / 1024 / 1024, 2) as size_mb
-            FROM information_schema.TABLES
-            WHERE table_schema = %s
+                (SELECT COUNT(*) FROM airline) as total_airlines,
+                (SELECT COUNT(*) 
+                 FROM airline a
+                 JOIN airline_info ai ON a.id = ai.airline
+                 WHERE CAST(ai.balance AS SIGNED) > 0) as active_airlines,
+                (SELECT COUNT(*) FROM airline WHERE airline_type = 2) as bot_airlines,
+                (SELECT COUNT(*) FROM airport) as total_airports,
+                (SELECT COUNT(*) FROM link) as total_links,
+                (SELECT COUNT(*) FROM airplane) as total_airplanes,
+                (SELECT COUNT(*) FROM airplane WHERE is_sold = 0) as active_airplanes,
+                (SELECT ROUND(SUM(data_length + index_length) / 1024 / 1024, 2)
+                 FROM information_schema.TABLES
+                 WHERE table_schema = %s) as database_size_mb,
+                (SELECT cycle FROM cycle LIMIT 1) as current_cycle,
+                (SELECT SUM(lc.sold_seats_economy + lc.sold_seats_business + lc.sold_seats_first)
+                 FROM link_consumption lc
+                 JOIN (SELECT MAX(cycle) as cycle FROM link_consumption) mx ON lc.cycle = mx.cycle) as last_cycle_passengers
         """, (DB_CONFIG['database'],))
-        result = cursor.fetchone()
-        stats['database_size_mb'] = result['size_mb'] if result['size_mb'] else 0
-        
-        # Current game cycle
-        cursor.execute("SELECT cycle FROM cycle LIMIT 1")
-        cycle_result = cursor.fetchone()
-        stats['current_cycle'] = cycle_result['cycle'] if cycle_result else 0
+        stats = cursor.fetchone()
         
-        # Total passenger count (last cycle) - sum sold seats
-        cursor.execute("""
-            SELECT SUM(sold_seats_economy + sold_seats_business + sold_seats_first) as total 
-            FROM link_consumption 
-            WHERE cycle = (SELECT MAX(cycle) FROM link_consumption)
-        """)
-        passenger_result = cursor.fetchone()
-        stats['last_cycle_passengers'] = passenger_result['total'] if passenger_result and passenger_result['total'] else 0
+        # Empty tables give NULL sums/cycle
+        for key in ('database_size_mb', 'current_cycle', 'last_cycle_passengers'):
+            if not stats[key]:
+                stats[key] = 0
         
         return jsonify(stats)
     except Exception as e:
@@ -444,45 +600,41 @@ def get_database_stats():
         conn.close()
 
 @app.route('/api/game/activity')
+@cache.cached(timeout=CACHE_TIMEOUT, query_string=True, response_filter=is_cacheable)
 def get_game_activity():
     """Get recent game activity"""
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    
     try:
-        # Recent airline creations - Fixed to not select balance from airline table
-        cursor.execute("""
-            SELECT a.name, a.id, a.airline_type
-            FROM airline a
-            ORDER BY a.id DESC
-            LIMIT 10
-        """)
-        recent_airlines = cursor.fetchall()
-        
-        # Top airlines by balance - Fixed to JOIN airline_info
-        cursor.execute("""
-            SELECT a.name, COALESCE(ai.balance, 0) as balance, a.airline_type
-            FROM airline a
-            LEFT JOIN airline_info ai ON a.id = ai.airline
-            WHERE a.airline_type != 2
-            ORDER BY ai.balance DESC
-            LIMIT 10
-        """)
-        top_airlines = cursor.fetchall()
-        
-        # Busiest routes (last cycle) - sum sold seats as passenger count
-        cursor.execute("""
-            SELECT 
-                lc.from_airport,
-                lc.to_airport,
-                (lc.sold_seats_economy + lc.sold_seats_business + lc.sold_seats_first) as passenger_count,
-                lc.cycle
-            FROM link_consumption lc
-            WHERE lc.cycle = (SELECT MAX(cycle) FROM link_consumption)
-            ORDER BY (lc.sold_seats_economy + lc.sold_seats_business + lc.sold_seats_first) DESC
-            LIMIT 10
-        """)
-        busiest_routes = cursor.fetchall()
+        recent_airlines, top_airlines, busiest_routes = fetch_concurrently(
+            # Recent airline creations - Fixed to not select balance from airline table
+            """
+                SELECT a.name, a.id, a.airline_type
+                FROM airline a
+                ORDER BY a.id DESC
+                LIMIT 10
+            """,
+            # Top airlines by balance - Fixed to JOIN airline_info
+            """
+                SELECT a.name, COALESCE(ai.balance, 0) as balance, a.airline_type
+                FROM airline a
+                LEFT JOIN airline_info ai ON a.id = ai.airline
+                WHERE a.airline_type != 2
+                ORDER BY ai.balance DESC
+                LIMIT 10
+            """,
+            # Busiest routes (last cycle) - sum sold seats as passenger count
+            """
+                WITH mx AS (SELECT MAX(cycle) as cycle FROM link_consumption)
+                SELECT 
+                    lc.from_airport,
+                    lc.to_airport,
+                    (lc.sold_seats_economy + lc.sold_seats_business + lc.sold_seats_first) as passenger_count,
+                    lc.cycle
+                FROM link_consumption lc
+                JOIN mx ON lc.cycle = mx.cycle
+                ORDER BY (lc.sold_seats_economy + lc.sold_seats_business + lc.sold_seats_first) DESC
+                LIMIT 10
+            """
+        )
         
         return jsonify({
             'recent_airlines': recent_airlines,
@@ -491,67 +643,85 @@ def get_game_activity():
         })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
-    finally:
-        cursor.close()
-        conn.close()
 
 @app.route('/api/containers')
 def get_containers():
     """Get Docker container status - returns empty if docker not available"""
     try:
         import subprocess
-        import json
-        
-        # Run docker ps command
-        result = subprocess.run(
-            ['docker', 'ps', '--format', '{{json .}}'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
         
-        if result.returncode != 0:
-            # Return empty list instead of error - docker not available in container
-            return jsonify({'containers': [], 'message': 'Docker not available in this environment'})
+        # Run docker ps command, one tab-separated line per container
+        proc = subprocess.Popen(
+            ['docker', 'ps', '--format', '{{.Names}}\t{{.Image}}\t{{.Status}}\t{{.Ports}}\t{{.ID}}'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+        # Kill docker if it hangs so the request does not block forever
+        timer = threading.Timer(5, proc.kill)
+        timer.start()
         
         containers = []
-        for line in result.stdout.strip().split('\n'):
-            if line:
-                try:
-                    container = json.loads(line)
-                    containers.append({
-                        'name': container.get('Names', 'Unknown'),
-                        'image': container.get('Image', 'Unknown'),
-                        'status': container.get('Status', 'Unknown'),
-                        'ports': container.get('Ports', ''),
-                        'id': container.get('ID', '')[:12]
-                    })
-                except json.JSONDecodeError:
+        try:
+            for line in iter(proc.stdout.readline, ''):
+                fields = line.rstrip('\n').split('\t', 4)
+                if len(fields) != 5:
+                    # Skip blank or malformed lines
                     continue
+                name, image, status, ports, container_id = fields
+                containers.append({
+                    'name': name,
+                    'image': image,
+                    'status': status,
+                    'ports': ports,
+                    'id': container_id[:12]
+                })
+        except BaseException:
+            # Reading stopped early, don't leave docker running
+            if proc.poll() is None:
+                proc.kill()
+            raise
+        finally:
+            # Always reap docker
+            proc.wait()
+            timer.cancel()
+            proc.stdout.close()
+        
+        if proc.returncode < 0:
+            return jsonify({'containers': [], 'message': 'Docker command timeout'})
+        
+        if proc.returncode != 0:
+            # Return empty list instead of error - docker not available in container
+            return jsonify({'containers': [], 'message': 'Docker not available in this environment'})
         
         return jsonify({'containers': containers})
-    except subprocess.TimeoutExpired:
-        return jsonify({'containers': [], 'message': 'Docker command timeout'})
     except FileNotFoundError:
         return jsonify({'containers': [], 'message': 'Docker not installed in this environment'})
     except Exception as e:
         return jsonify({'containers': [], 'message': str(e)})
 
+# Whether the log table exists. The schema does not change at runtime, so this is
+# probed once per process; /api/logs/refresh-schema resets it after a migration.
+_LOG_TABLE_EXISTS = None
+
 @app.route('/api/logs/recent')
 def get_recent_logs():
     """Get recent system/application logs"""
+    global _LOG_TABLE_EXISTS
     conn = get_db_connection()
     cursor = conn.cursor(dictionary=True)
     
     try:
         # Check if log table exists
-        cursor.execute("""
-            SELECT COUNT(*) as count
-            FROM information_schema.TABLES
-            WHERE table_schema = %s AND table_name = 'log'
-        """, (DB_CONFIG['database'],))
+        if _LOG_TABLE_EXISTS is None:
+            cursor.execute("""
+                SELECT COUNT(*) as count
+                FROM information_schema.TABLES
+                WHERE table_schema = %s AND table_name = 'log'
+            """, (DB_CONFIG['database'],))
+            _LOG_TABLE_EXISTS = cursor.fetchone()['count'] > 0
         
-        if cursor.fetchone()['count'] == 0:
+        if not _LOG_TABLE_EXISTS:
             return jsonify({'logs': [], 'message': 'Log table not found'})
         
         # Get recent logs - use cycle instead of log_time (which doesn't exist)
@@ -570,73 +740,65 @@ def get_recent_logs():
         cursor.close()
         conn.close()
 
+@app.route('/api/logs/refresh-schema', methods=['POST'])
+def refresh_schema():
+    """Forget cached schema checks and HQ airport lookups so they are re-probed after a migration"""
+    global _LOG_TABLE_EXISTS, _USER_FULLTEXT
+    _LOG_TABLE_EXISTS = None
+    _USER_FULLTEXT = None
+    _LARGEST_AIRPORT.clear()
+    return jsonify({
+        'success': True,
+        'message': 'Schema checks will be refreshed on the next request.'
+    })
+
 @app.route('/api/alerts')
 def get_alerts():
     """Get system alerts and warnings"""
     alerts = []
     
     try:
-        # Check CPU usage
-        cpu_percent = psutil.cpu_percent(interval=1)
-        if cpu_percent > 90:
-            alerts.append({
-                'level': 'critical',
-                'message': f'CPU usage is critically high: {cpu_percent}%',
-                'timestamp': datetime.now().isoformat()
-            })
-        elif cpu_percent > 75:
-            alerts.append({
-                'level': 'warning',
-                'message': f'CPU usage is high: {cpu_percent}%',
-                'timestamp': datetime.now().isoformat()
-            })
-        
-        # Check memory usage
-        memory = psutil.virtual_memory()
-        if memory.percent > 90:
-            alerts.append({
-                'level': 'critical',
-                'message': f'Memory usage is critically high: {memory.percent}%',
-                'timestamp': datetime.now().isoformat()
-            })
-        elif memory.percent > 75:
-            alerts.append({
-                'level': 'warning',
-                'message': f'Memory usage is high: {memory.percent}%',
-                'timestamp': datetime.now().isoformat()
-            })
-        
-        # Check disk usage
-        disk = psutil.disk_usage('/')
-        if disk.percent > 90:
-            alerts.append({
-                'level': 'critical',
-                'message': f'Disk usage is critically high: {disk.percent}%',
-                'timestamp': datetime.now().isoformat()
-            })
-        elif disk.percent > 80:
-            alerts.append({
-                'level': 'warning',
-                'message': f'Disk usage is high: {disk.percent}%',
-                'timestamp': datetime.now().isoformat()
-            })
-        
-        # Check database connection
+        timestamp = datetime.now().isoformat()
+        
+        # Check CPU, memory and disk usage against (warning, critical) thresholds
+        for name, percent, warning, critical in (
+            ('CPU', _CPU, 75, 90),
+            ('Memory', _MEM.percent, 75, 90),
+            ('Disk', _DISK.percent, 80, 90),
+        ):
+            if percent > critical:
+                alerts.append({
+                    'level': 'critical',
+                    'message': f'{name} usage is critically high: {percent}%',
+                    'timestamp': timestamp
+                })
+            elif percent > warning:
+                alerts.append({
+                    'level': 'warning',
+                    'message': f'{name} usage is high: {percent}%',
+                    'timestamp': timestamp
+                })
+        
+        # Check database connection (pooled, so no new handshake per poll)
         try:
             conn = get_db_connection()
-            conn.close()
+            try:
+                if not conn.is_connected():
+                    raise Exception('pooled connection is not connected')
+            finally:
+                conn.close()
         except Exception as e:
             alerts.append({
                 'level': 'critical',
                 'message': f'Database connection failed: {str(e)}',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': timestamp
             })
         
         if not alerts:
             alerts.append({
                 'level': 'info',
                 'message': 'All systems operational',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': timestamp
             })
         
         return jsonify({'alerts': alerts})
@@ -652,7 +814,7 @@ def get_bots():
     try:
         # Get all bot airlines - Fixed to use correct schema
         # airline_type: 0=REGULAR, 1=DISCOUNT, 2=NON_PLAYER, 3=LUXURY, 4=REGIONAL
-        cursor.execute("""
+        cursor.execute(f"""
             SELECT 
                 a.id,
                 a.name,
@@ -660,6 +822,7 @@ def get_bots():
                 COALESCE(ai.balance, 0) as balance,
                 COALESCE(ai.reputation, 0) as reputation,
                 COALESCE(ai.service_quality, 0) as service_quality,
+                {PERSONALITY_SQL} as personality,
                 (SELECT COUNT(*) FROM link WHERE airline = a.id) as route_count,
                 (SELECT COUNT(*) FROM airplane WHERE owner = a.id) as aircraft_count,
                 (SELECT COUNT(*) FROM airline_base WHERE airline = a.id) as base_count
@@ -670,58 +833,65 @@ def get_bots():
         """)
         bots = cursor.fetchall()
         
-        # Enhance each bot with personality and additional stats
-        for bot in bots:
-            # Determine personality based on cash, reputation, service quality
-            bot['personality'] = determine_personality(
-                bot.get('balance', 0), 
-                bot.get('reputation', 0), 
-                bot.get('service_quality', 0)
-            )
+        # Fetch routes, fleets and bases for all bots at once instead of per bot
+        routes_by_bot = defaultdict(list)
+        fleet_by_bot = defaultdict(list)
+        bases_by_bot = defaultdict(list)
+        if bots:
+            bot_ids = [bot['id'] for bot in bots]
+            placeholders = ','.join(['%s'] * len(bot_ids))
             
-            # Get route details
-            cursor.execute("""
+            # Get the 10 most recent routes of every bot in one query
+            cursor.execute(f"""
                 SELECT 
-                    l.id,
+                    r.airline,
+                    r.id,
                     from_airport.iata as from_iata,
                     from_airport.city as from_city,
                     to_airport.iata as to_iata,
                     to_airport.city as to_city,
-                    l.distance,
-                    l.frequency,
-                    l.price_economy,
-                    l.price_business,
-                    l.price_first,
-                    l.quality,
-                    l.capacity_economy,
-                    l.capacity_business,
-                    l.capacity_first
-                FROM link l
-                JOIN airport from_airport ON l.from_airport = from_airport.id
-                JOIN airport to_airport ON l.to_airport = to_airport.id
-                WHERE l.airline = %s
-                ORDER BY l.id DESC
-                LIMIT 10
-            """, (bot['id'],))
-            bot['routes'] = cursor.fetchall()
+                    r.distance,
+                    r.frequency,
+                    r.price_economy,
+                    r.price_business,
+                    r.price_first,
+                    r.quality,
+                    r.capacity_economy,
+                    r.capacity_business,
+                    r.capacity_first
+                FROM (
+                    SELECT l.*, ROW_NUMBER() OVER (PARTITION BY l.airline ORDER BY l.id DESC) as rn
+                    FROM link l
+                    WHERE l.airline IN ({placeholders})
+                ) r
+                JOIN airport from_airport ON r.from_airport = from_airport.id
+                JOIN airport to_airport ON r.to_airport = to_airport.id
+                WHERE r.rn <= 10
+                ORDER BY r.airline, r.id DESC
+            """, bot_ids)
+            for route in cursor.fetchall():
+                routes_by_bot[route.pop('airline')].append(route)
             
-            # Get aircraft fleet
-            cursor.execute("""
+            # Get aircraft fleets
+            cursor.execute(f"""
                 SELECT 
+                    owner,
                     model as name,
                     COUNT(*) as count,
                     AVG(airplane_condition) as avg_condition,
                     SUM(CASE WHEN is_sold = 0 THEN 1 ELSE 0 END) as available
                 FROM airplane
-                WHERE owner = %s
-                GROUP BY model
-                ORDER BY count DESC
-            """, (bot['id'],))
-            bot['fleet'] = cursor.fetchall()
+                WHERE owner IN ({placeholders})
+                GROUP BY owner, model
+                ORDER BY owner, count DESC
+            """, bot_ids)
+            for model in cursor.fetchall():
+                fleet_by_bot[model.pop('owner')].append(model)
             
             # Get bases
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT 
+                    ab.airline,
                     ap.iata,
                     ap.city,
                     ap.name as airport_name,
@@ -729,47 +899,41 @@ def get_bots():
                     ab.founded_cycle
                 FROM airline_base ab
                 JOIN airport ap ON ab.airport = ap.id
-                WHERE ab.airline = %s
-            """, (bot['id'],))
-            bot['bases'] = cursor.fetchall()
+                WHERE ab.airline IN ({placeholders})
+            """, bot_ids)
+            for base in cursor.fetchall():
+                bases_by_bot[base.pop('airline')].append(base)
+        
+        for bot in bots:
+            bot['routes'] = routes_by_bot[bot['id']]
+            bot['fleet'] = fleet_by_bot[bot['id']]
+            bot['bases'] = bases_by_bot[bot['id']]
             
         return jsonify({'bots': bots})
     finally:
         cursor.close()
         conn.close()
 
-def determine_personality(balance, reputation, service_quality):
-    """Determine bot personality based on stats (mirrors BotAISimulation.scala logic)"""
-    # Convert to float to handle potential string values from database
-    try:
-        balance = float(balance) if balance else 0
-        reputation = float(reputation) if reputation else 0
-        service_quality = float(service_quality) if service_quality else 0
-    except (ValueError, TypeError):
-        balance = 0
-        reputation = 0
-        service_quality = 0
-    
-    cash_ratio = balance / 10000000.0  # Normalize to 10M
-    
-    if service_quality > 70:
-        return "PREMIUM"
-    elif cash_ratio < 2 and reputation < 30:
-        return "BUDGET"
-    elif reputation > 70:
-        return "CONSERVATIVE"
-    elif cash_ratio > 10:
-        return "AGGRESSIVE"
-    elif service_quality < 40:
-        return "REGIONAL"
-    else:
-        return "BALANCED"
+PERSONALITIES = ('AGGRESSIVE', 'CONSERVATIVE', 'BALANCED', 'REGIONAL', 'PREMIUM', 'BUDGET')
+
+# Bot personality from its stats (mirrors BotAISimulation.scala logic), to be selected
+# from airline a JOIN airline_info ai. Missing stats count as 0.
+PERSONALITY_SQL = """
+    CASE
+        WHEN COALESCE(ai.service_quality, 0) > 70 THEN 'PREMIUM'
+        WHEN COALESCE(ai.balance, 0) / 10000000.0 < 2 AND COALESCE(ai.reputation, 0) < 30 THEN 'BUDGET'
+        WHEN COALESCE(ai.reputation, 0) > 70 THEN 'CONSERVATIVE'
+        WHEN COALESCE(ai.balance, 0) / 10000000.0 > 10 THEN 'AGGRESSIVE'
+        WHEN COALESCE(ai.service_quality, 0) < 40 THEN 'REGIONAL'
+        ELSE 'BALANCED'
+    END"""
 
 @app.route('/api/bots/<int:bot_id>/routes')
 def get_bot_routes(bot_id):
     """Get detailed routes for a specific bot"""
     conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
+    # Plain tuple cursor: route dicts are built once below
+    cursor = conn.cursor()
     
     try:
         cursor.execute("""
@@ -796,20 +960,19 @@ def get_bot_routes(bot_id):
                 l.sold_seats_economy,
                 l.sold_seats_business,
                 l.sold_seats_first,
-                l.flight_type
+                l.flight_type,
+                COALESCE(CAST(
+                    100 * (COALESCE(l.sold_seats_economy, 0) + COALESCE(l.sold_seats_business, 0) + COALESCE(l.sold_seats_first, 0))
+                    / NULLIF(COALESCE(l.capacity_economy, 0) + COALESCE(l.capacity_business, 0) + COALESCE(l.capacity_first, 0), 0)
+                AS DOUBLE), 0) as load_factor
             FROM link l
             JOIN airport from_airport ON l.from_airport = from_airport.id
             JOIN airport to_airport ON l.to_airport = to_airport.id
             WHERE l.airline = %s
             ORDER BY l.id DESC
         """, (bot_id,))
-        routes = cursor.fetchall()
-        
-        # Calculate load factors
-        for route in routes:
-            total_capacity = (route['capacity_economy'] or 0) + (route['capacity_business'] or 0) + (route['capacity_first'] or 0)
-            total_sold = (route['sold_seats_economy'] or 0) + (route['sold_seats_business'] or 0) + (route['sold_seats_first'] or 0)
-            route['load_factor'] = (total_sold / total_capacity * 100) if total_capacity > 0 else 0
+        columns = cursor.column_names
+        routes = [dict(zip(columns, row)) for row in cursor.fetchall()]
         
         return jsonify({'routes': routes})
     finally:
@@ -818,102 +981,117 @@ def get_bot_routes(bot_id):
 
 @app.route('/api/bots/<int:bot_id>/aircraft')
 def get_bot_aircraft(bot_id):
-    """Get detailed aircraft for a specific bot"""
+    """Stream detailed aircraft for a specific bot"""
+    limit = min(int(request.args.get('limit', 1000)), 5000)
+    offset = int(request.args.get('offset', 0))
+    
     conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
+    # Unbuffered cursor: rows are read from the server as they are streamed out
+    cursor = conn.cursor(buffered=False)
     
     try:
         cursor.execute("""
             SELECT 
-                id,
-                model as name,
-                airplane_condition as condition,
-                depreciation_rate,
-                value,
-                purchase_date,
-                is_sold,
-                dealer_ratio,
-                configuration
-            FROM airplane
-            WHERE owner = %s
-            ORDER BY model, id
-        """, (bot_id,))
-        aircraft = cursor.fetchall()
-        
-        return jsonify({'aircraft': aircraft})
-    finally:
+                ap.id,
+                ap.model as name,
+                ap.airplane_condition as `condition`,
+                ap.depreciation_rate,
+                ap.value,
+                ap.purchased_cycle,
+                ap.is_sold,
+                ap.dealer_ratio,
+                ac.configuration
+            FROM airplane ap
+            LEFT JOIN airplane_configuration ac ON ac.airplane = ap.id
+            WHERE ap.owner = %s
+            ORDER BY ap.model, ap.id
+            LIMIT %s OFFSET %s
+        """, (bot_id, limit, offset))
+    except Exception:
         cursor.close()
         conn.close()
+        raise
+    
+    def generate():
+        columns = cursor.column_names
+        yield '{"aircraft":['
+        for i, row in enumerate(cursor):
+            yield (',' if i else '') + app.json.dumps(dict(zip(columns, row)))
+        yield ']}'
+    
+    def release():
+        # Drain rows left unread if the client disconnected mid-stream
+        if conn.unread_result:
+            conn.consume_results()
+        cursor.close()
+        conn.close()
+    
+    response = Response(stream_with_context(generate()), mimetype='application/json')
+    # Runs when the response is closed, even if the body is never iterated (e.g. HEAD)
+    response.call_on_close(release)
+    return response
 
 @app.route('/api/bots/summary')
+@cache.cached(timeout=CACHE_TIMEOUT, query_string=True, response_filter=is_cacheable)
 def get_bots_summary():
     """Get summary statistics for all bots"""
     conn = get_db_connection()
     cursor = conn.cursor(dictionary=True)
     
     try:
-        # Total bots - Fixed to use airline_type = 2
-        cursor.execute("SELECT COUNT(*) as total FROM airline WHERE airline_type = 2")
-        total_bots = cursor.fetchone()['total']
-        
-        # Total routes
+        # Bot totals in a single round trip
         cursor.execute("""
-            SELECT COUNT(*) as total 
-            FROM link l
-            JOIN airline a ON l.airline = a.id
-            WHERE a.airline_type = 2
-        """)
-        total_routes = cursor.fetchone()['total']
-        
-        # Total aircraft
-        cursor.execute("""
-            SELECT COUNT(*) as total 
-            FROM airplane ap
-            JOIN airline a ON ap.owner = a.id
-            WHERE a.airline_type = 2 AND ap.is_sold = 0
+            SELECT 
+                (SELECT COUNT(*) FROM airline WHERE airline_type = 2) as total_bots,
+                (SELECT COUNT(*) 
+                 FROM link l
+                 JOIN airline a ON l.airline = a.id
+                 WHERE a.airline_type = 2) as total_routes,
+                (SELECT COUNT(*) 
+                 FROM airplane ap
+                 JOIN airline a ON ap.owner = a.id
+                 WHERE a.airline_type = 2 AND ap.is_sold = 0) as total_aircraft
         """)
-        total_aircraft = cursor.fetchone()['total']
+        totals = cursor.fetchone()
         
-        # Personality distribution - Fixed to JOIN airline_info
-        cursor.execute("""
-            SELECT 
-                a.id,
-                COALESCE(ai.balance, 0) as balance,
-                COALESCE(ai.reputation, 0) as reputation,
-                COALESCE(ai.service_quality, 0) as service_quality
+        # Personality distribution, classified and counted server-side
+        cursor.execute(f"""
+            SELECT {PERSONALITY_SQL} as personality, COUNT(*) as count
             FROM airline a
             LEFT JOIN airline_info ai ON a.id = ai.airline
             WHERE a.airline_type = 2
+            GROUP BY personality
         """)
-        bots_data = cursor.fetchall()
-        
-        personality_counts = {
-            'AGGRESSIVE': 0,
-            'CONSERVATIVE': 0,
-            'BALANCED': 0,
-            'REGIONAL': 0,
-            'PREMIUM': 0,
-            'BUDGET': 0
-        }
-        
-        for bot in bots_data:
-            personality = determine_personality(
-                bot['balance'],
-                bot['reputation'],
-                bot['service_quality']
-            )
-            personality_counts[personality] += 1
+        
+        counts = {row['personality']: row['count'] for row in cursor.fetchall()}
+        personality_counts = {personality: counts.get(personality, 0) for personality in PERSONALITIES}
         
         return jsonify({
-            'total_bots': total_bots,
-            'total_routes': total_routes,
-            'total_aircraft': total_aircraft,
+            'total_bots': totals['total_bots'],
+            'total_routes': totals['total_routes'],
+            'total_aircraft': totals['total_aircraft'],
             'personality_distribution': personality_counts
         })
     finally:
         cursor.close()
         conn.close()
 
+# The current cycle only changes once per turn, so the reset/create endpoints share a
+# short-lived copy instead of querying it on every call
+CYCLE_CACHE_TTL = 5.0
+_CYCLE_CACHE = {'value': None, 'ts': 0.0}
+
+def get_current_cycle_cached(cursor, ttl=CYCLE_CACHE_TTL):
+    """Current game cycle (0 if none yet), re-read at most once per ttl seconds"""
+    now = time.monotonic()
+    if _CYCLE_CACHE['value'] is not None and now - _CYCLE_CACHE['ts'] < ttl:
+        return _CYCLE_CACHE['value']
+    cursor.execute("SELECT cycle FROM cycle ORDER BY cycle DESC LIMIT 1")
+    row = cursor.fetchone()
+    _CYCLE_CACHE['value'] = row['cycle'] if row else 0
+    _CYCLE_CACHE['ts'] = now
+    return _CYCLE_CACHE['value']
+
 @app.route('/api/admin/trigger-turn', methods=['POST'])
 def trigger_turn():
     """Trigger an immediate turn/cycle by creating a trigger file in the shared volume"""
@@ -922,10 +1100,18 @@ def trigger_turn():
         trigger_dir = '/tmp/admin-triggers'
         os.makedirs(trigger_dir, exist_ok=True)
         
-        # Create the trigger file
+        # Create the trigger file. The simulation acts as soon as the file exists, so write
+        # it under a temporary name, unique per request so overlapping triggers don't clash,
+        # and rename it into place (atomic on POSIX)
         trigger_file = os.path.join(trigger_dir, 'trigger_turn')
-        with open(trigger_file, 'w') as f:
+        with tempfile.NamedTemporaryFile('w', dir=trigger_dir, prefix='trigger_turn.', suffix='.tmp', delete=False) as f:
             f.write(f'trigger_requested_at={datetime.now().isoformat()}')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(f.name, trigger_file)
+        
+        # The cycle is about to advance, make the next reset/create re-read it
+        _CYCLE_CACHE['ts'] = 0.0
         
         return jsonify({
             'success': True,
@@ -997,24 +1183,183 @@ AIRLINE_CODE_MAP = {
     'Vietnam Airlines': 'VN',
 }
 
+def _name_matcher(mapping):
+    """Compile a map's names into one case-insensitive pattern (longest name first), with a lowercase lookup"""
+    lookup = {name.lower(): value for name, value in mapping.items()}
+    pattern = re.compile('|'.join(re.escape(name) for name in sorted(lookup, key=len, reverse=True)))
+    return pattern, lookup
+
+# Each name is scanned once for all known airlines instead of once per map entry
+_AIRLINE_COUNTRY_RE, _AIRLINE_COUNTRY_LOWER = _name_matcher(AIRLINE_COUNTRY_MAP)
+_AIRLINE_CODE_RE, _AIRLINE_CODE_LOWER = _name_matcher(AIRLINE_CODE_MAP)
+
+@lru_cache(maxsize=1024)
 def get_country_for_airline(name):
     """Get country code for an airline based on its name"""
-    for airline_prefix, country_code in AIRLINE_COUNTRY_MAP.items():
-        if airline_prefix.lower() in name.lower():
-            return country_code
-    return None
+    match = _AIRLINE_COUNTRY_RE.search(name.lower())
+    return _AIRLINE_COUNTRY_LOWER[match.group()] if match else None
 
+@lru_cache(maxsize=1024)
 def get_airline_code(name):
     """Get IATA-like code for an airline based on its name"""
-    for airline_prefix, code in AIRLINE_CODE_MAP.items():
-        if airline_prefix.lower() in name.lower():
-            return code
+    match = _AIRLINE_CODE_RE.search(name.lower())
+    if match:
+        return _AIRLINE_CODE_LOWER[match.group()]
     # Generate a 2-char code from the name
     words = name.replace('[bot]', '').strip().split()
     if len(words) >= 2:
         return (words[0][0] + words[1][0]).upper()
     return name[:2].upper()
 
+# Largest airport per country, used as a bot HQ. Airports are static game data, so
+# this is filled once per process; /api/logs/refresh-schema clears it.
+_LARGEST_AIRPORT = {}
+_MISSING = object()
+
+def _largest_airport_in(cursor, country_code):
+    """Id of the largest airport in a country (None if the country has none)"""
+    # Read the shared dict once; refresh-schema may clear it at any time
+    airport_id = _LARGEST_AIRPORT.get(country_code, _MISSING)
+    if airport_id is _MISSING:
+        cursor.execute("""
+            SELECT id FROM airport 
+            WHERE country_code = %s 
+            ORDER BY airport_size DESC, population DESC 
+            LIMIT 1
+        """, (country_code,))
+        row = cursor.fetchone()
+        airport_id = row['id'] if row else None
+        _LARGEST_AIRPORT[country_code] = airport_id
+    return airport_id
+
+def _reset_bots(cursor, bots, current_cycle):
+    """Bankruptcy-reset the given bots (rows with id, name, country_code) in the open transaction, returning counts"""
+    # Materialize the bot, link and airplane ids once so each DELETE/UPDATE below
+    # joins a small indexed table instead of re-scanning link/airplane per statement.
+    # The whole sequence is sent as one script, a single round trip.
+    delete_links = "DELETE l FROM link l JOIN bot_links bl ON l.id = bl.id"
+    delete_airplanes = "DELETE ap FROM airplane ap JOIN bot_planes bp ON ap.id = bp.id"
+    delete_bases = "DELETE ab FROM airline_base ab JOIN bot_ids b ON ab.airline = b.id"
+    statements = [
+        "DROP TEMPORARY TABLE IF EXISTS bot_ids, bot_links, bot_planes",
+        "CREATE TEMPORARY TABLE bot_ids (id INT PRIMARY KEY) ENGINE=MEMORY",
+        f"INSERT INTO bot_ids (id) VALUES {','.join(['(%s)'] * len(bots))}",
+        """CREATE TEMPORARY TABLE bot_links (id INT PRIMARY KEY) ENGINE=MEMORY
+           SELECT l.id FROM link l JOIN bot_ids b ON l.airline = b.id""",
+        """CREATE TEMPORARY TABLE bot_planes (id INT PRIMARY KEY) ENGINE=MEMORY
+           SELECT ap.id FROM airplane ap JOIN bot_ids b ON ap.owner = b.id""",
+        # Delete link assignments first (foreign key), then consumptions and links (routes)
+        "DELETE la FROM link_assignment la JOIN bot_links bl ON la.link = bl.id",
+        "DELETE lc FROM link_consumption lc JOIN bot_links bl ON lc.link = bl.id",
+        delete_links,
+        # Delete airplane configurations, then airplanes
+        "DELETE ac FROM airplane_configuration ac JOIN bot_planes bp ON ac.airplane = bp.id",
+        delete_airplanes,
+        # Delete ALL bases of the bots
+        delete_bases,
+        # Delete airline appeal (loyalty/awareness)
+        "DELETE aa FROM airline_appeal aa JOIN bot_ids b ON aa.airline = b.id",
+        # Reset balance to 10,000,000 and reputation to 0
+        """UPDATE airline_info ai
+           JOIN bot_ids b ON ai.airline = b.id
+           SET ai.balance = '10000000', ai.reputation = 0, ai.service_quality = 50.00""",
+        "DROP TEMPORARY TABLE bot_ids, bot_links, bot_planes",
+    ]
+    rowcounts = execute_script(cursor, statements, [bot['id'] for bot in bots])
+    routes_deleted = rowcounts[delete_links]
+    aircraft_deleted = rowcounts[delete_airplanes]
+    bases_deleted = rowcounts[delete_bases]
+    
+    # Always try to infer country code from name first (more accurate),
+    # falling back to the database value if we couldn't infer
+    country_by_bot = {bot['id']: get_country_for_airline(bot['name']) or bot['country_code'] for bot in bots}
+    
+    # Find the largest airport in each of the bots' countries for HQ, in one query
+    hq_by_cc = {}
+    needed_ccs = set(country_by_bot.values()) - {None}
+    if needed_ccs:
+        cc_placeholders = ','.join(['%s'] * len(needed_ccs))
+        cursor.execute(f"""
+            SELECT country_code, id FROM (
+                SELECT country_code, id,
+                       ROW_NUMBER() OVER (PARTITION BY country_code ORDER BY airport_size DESC, population DESC) as rn
+                FROM airport
+                WHERE country_code IN ({cc_placeholders})
+            ) t
+            WHERE rn = 1
+        """, tuple(needed_ccs))
+        hq_by_cc = {row['country_code']: row['id'] for row in cursor.fetchall()}
+    
+    # One row per bot with its new home country/code and HQ airport (starter airplanes are
+    # based at the HQ if the bot has one). Everything below runs server-side in one script.
+    home_rows = [
+        (bot['id'], hq_by_cc.get(country_by_bot[bot['id']]), country_by_bot[bot['id']], get_airline_code(bot['name']))
+        for bot in bots
+    ]
+    
+    # Create new HQ bases at scale 1
+    insert_hqs = """INSERT INTO airline_base (airport, airline, scale, founded_cycle, headquarter, country)
+           SELECT home, airline, 1, %s, 1, country_code
+           FROM bot_homes
+           WHERE home IS NOT NULL AND country_code IS NOT NULL"""
+    # Give every bot 5 random cheap airplanes (price < 40,000,000), each linked to an
+    # all-economy configuration template for its airline/model
+    insert_airplanes = """INSERT INTO airplane (model, owner, constructed_cycle, purchased_cycle, 
+                              airplane_condition, depreciation_rate, value, is_sold, 
+                              dealer_ratio, home, purchase_rate, version)
+           SELECT model, airline, %s, %s, 100.0, 0, price, 0, 1.0, home, 1.0, 0
+           FROM (
+               SELECT m.id as model, m.price, b.airline, b.home,
+                      ROW_NUMBER() OVER (PARTITION BY b.airline ORDER BY RAND()) as rn
+               FROM bot_homes b
+               CROSS JOIN airplane_model m
+               WHERE m.price < 40000000
+           ) picks
+           WHERE rn <= 5"""
+    statements = [
+        "DROP TEMPORARY TABLE IF EXISTS bot_homes",
+        """CREATE TEMPORARY TABLE bot_homes (
+               airline INT PRIMARY KEY, home INT, country_code VARCHAR(256), airline_code VARCHAR(256)
+           ) ENGINE=MEMORY""",
+        f"INSERT INTO bot_homes VALUES {','.join(['(%s, %s, %s, %s)'] * len(home_rows))}",
+        # Update country_code (if we have one) and airline_code
+        """UPDATE airline_info ai
+           JOIN bot_homes b ON ai.airline = b.airline
+           SET ai.country_code = COALESCE(b.country_code, ai.country_code), ai.airline_code = b.airline_code""",
+        insert_hqs,
+        insert_airplanes,
+        # Create the templates that don't exist yet
+        """INSERT INTO airplane_configuration_template (airline, model, economy, business, first, is_default)
+           SELECT DISTINCT ap.owner, ap.model, m.capacity, 0, 0, 1
+           FROM bot_homes b
+           JOIN airplane ap ON ap.owner = b.airline
+           JOIN airplane_model m ON m.id = ap.model
+           WHERE NOT EXISTS (
+               SELECT 1 FROM airplane_configuration_template t
+               WHERE t.airline = ap.owner AND t.model = ap.model
+           )""",
+        # The bots' old airplanes were deleted above, so these are exactly the new ones
+        """INSERT INTO airplane_configuration (airplane, configuration)
+           SELECT ap.id, MIN(t.id)
+           FROM bot_homes b
+           JOIN airplane ap ON ap.owner = b.airline
+           JOIN airplane_configuration_template t ON t.airline = ap.owner AND t.model = ap.model
+           GROUP BY ap.id""",
+        "DROP TEMPORARY TABLE bot_homes",
+    ]
+    params = [value for row in home_rows for value in row] + [current_cycle] * 3
+    rowcounts = execute_script(cursor, statements, params)
+    hqs_created = rowcounts[insert_hqs]
+    aircraft_added = rowcounts[insert_airplanes]
+    
+    return {
+        'routes_deleted': routes_deleted,
+        'aircraft_deleted': aircraft_deleted,
+        'bases_deleted': bases_deleted,
+        'hqs_created': hqs_created,
+        'aircraft_added': aircraft_added,
+    }
+
 @app.route('/api/admin/reset-bots', methods=['POST'])
 def reset_bots():
     """Reset all bot airlines - like bankruptcy: clear routes, aircraft, reset HQ to level 1 in home country, reset reputation"""
@@ -1042,137 +1387,17 @@ def reset_bots():
         
         bot_names = [bot['name'] for bot in bots]
         
-        routes_deleted = 0
-        aircraft_deleted = 0
-        bases_deleted = 0
-        aircraft_added = 0
-        hqs_created = 0
-        
         # Get current cycle for airplane construction
-        cursor.execute("SELECT MAX(cycle) as current_cycle FROM cycle")
-        cycle_result = cursor.fetchone()
-        current_cycle = cycle_result['current_cycle'] if cycle_result and cycle_result['current_cycle'] else 0
+        current_cycle = get_current_cycle_cached(cursor)
         
-        # Get cheap airplane models (price < 40,000,000)
-        cursor.execute("SELECT id, name, price, capacity FROM airplane_model WHERE price < 40000000 ORDER BY price")
-        cheap_models = cursor.fetchall()
-        
-        for bot in bots:
-            bot_id = bot['id']
-            bot_name = bot['name']
-            
-            # Always try to infer country code from name first (more accurate)
-            country_code = get_country_for_airline(bot_name)
-            # Fall back to database value if we couldn't infer
-            if not country_code:
-                country_code = bot['country_code']
-            
-            # Delete link assignments first (foreign key)
-            cursor.execute("DELETE FROM link_assignment WHERE link IN (SELECT id FROM link WHERE airline = %s)", (bot_id,))
-            
-            # Delete link consumptions
-            cursor.execute("DELETE FROM link_consumption WHERE link IN (SELECT id FROM link WHERE airline = %s)", (bot_id,))
-            
-            # Delete links (routes)
-            cursor.execute("DELETE FROM link WHERE airline = %s", (bot_id,))
-            routes_deleted += cursor.rowcount
-            
-            # Delete airplane configurations
-            cursor.execute("DELETE FROM airplane_configuration WHERE airplane IN (SELECT id FROM airplane WHERE owner = %s)", (bot_id,))
-            
-            # Delete airplanes
-            cursor.execute("DELETE FROM airplane WHERE owner = %s", (bot_id,))
-            aircraft_deleted += cursor.rowcount
-            
-            # Delete ALL bases for this airline
-            cursor.execute("DELETE FROM airline_base WHERE airline = %s", (bot_id,))
-            bases_deleted += cursor.rowcount
-            
-            # Delete airline appeal (loyalty/awareness)
-            cursor.execute("DELETE FROM airline_appeal WHERE airline = %s", (bot_id,))
-            
-            # Reset balance to 200,000, reputation to 0, and update country_code and airline_code
-            airline_code = get_airline_code(bot_name)
-            if country_code:
-                cursor.execute("""
-                    UPDATE airline_info 
-                    SET balance = '10000000', reputation = 0, service_quality = 50.00, country_code = %s, airline_code = %s
-                    WHERE airline = %s
-                """, (country_code, airline_code, bot_id))
-            else:
-                cursor.execute("""
-                    UPDATE airline_info 
-                    SET balance = '10000000', reputation = 0, service_quality = 50.00, airline_code = %s
-                    WHERE airline = %s
-                """, (airline_code, bot_id))
-            
-            # Find the largest airport in the bot's country for HQ
-            hq_airport = None
-            if country_code:
-                cursor.execute("""
-                    SELECT id FROM airport 
-                    WHERE country_code = %s 
-                    ORDER BY airport_size DESC, population DESC 
-                    LIMIT 1
-                """, (country_code,))
-                airport_result = cursor.fetchone()
-                if airport_result:
-                    hq_airport = airport_result['id']
-            
-            # Create new HQ base at scale 1
-            if hq_airport and country_code:
-                cursor.execute("""
-                    INSERT INTO airline_base (airport, airline, scale, founded_cycle, headquarter, country)
-                    VALUES (%s, %s, 1, %s, 1, %s)
-                """, (hq_airport, bot_id, current_cycle, country_code))
-                hqs_created += 1
-            
-            # Add 5 random cheap airplanes with configurations
-            if cheap_models:
-                selected_models = random.sample(cheap_models, min(5, len(cheap_models)))
-                for model in selected_models:
-                    # Insert the airplane
-                    cursor.execute("""
-                        INSERT INTO airplane (model, owner, constructed_cycle, purchased_cycle, 
-                                             airplane_condition, depreciation_rate, value, is_sold, 
-                                             dealer_ratio, home, purchase_rate, version)
-                        VALUES (%s, %s, %s, %s, 100.0, 0, %s, 0, 1.0, %s, 1.0, 0)
-                    """, (model['id'], bot_id, current_cycle, current_cycle, model['price'], hq_airport))
-                    airplane_id = cursor.lastrowid
-                    
-                    # Create a configuration template for this airline/model (all economy)
-                    # First check if one exists
-                    cursor.execute("""
-                        SELECT id FROM airplane_configuration_template 
-                        WHERE airline = %s AND model = %s
-                        LIMIT 1
-                    """, (bot_id, model['id']))
-                    config_template = cursor.fetchone()
-                    
-                    if not config_template:
-                        # Create a new all-economy configuration
-                        cursor.execute("""
-                            INSERT INTO airplane_configuration_template (airline, model, economy, business, first, is_default)
-                            VALUES (%s, %s, %s, 0, 0, 1)
-                        """, (bot_id, model['id'], model['capacity']))
-                        config_id = cursor.lastrowid
-                    else:
-                        config_id = config_template['id']
-                    
-                    # Link the airplane to its configuration
-                    cursor.execute("""
-                        INSERT INTO airplane_configuration (airplane, configuration)
-                        VALUES (%s, %s)
-                        ON DUPLICATE KEY UPDATE configuration = %s
-                    """, (airplane_id, config_id, config_id))
-                    
-                    aircraft_added += 1
+        counts = _reset_bots(cursor, bots, current_cycle)
         
         conn.commit()
+        cache.clear()
         
         return jsonify({
             'success': True,
-            'message': f'Reset {len(bots)} bot airlines. Deleted {routes_deleted} routes, {aircraft_deleted} aircraft, {bases_deleted} bases. Created {hqs_created} HQs. Added {aircraft_added} new aircraft. Balance reset to $10,000,000, reputation to 0.',
+            'message': f'Reset {len(bots)} bot airlines. Deleted {counts["routes_deleted"]} routes, {counts["aircraft_deleted"]} aircraft, {counts["bases_deleted"]} bases. Created {counts["hqs_created"]} HQs. Added {counts["aircraft_added"]} new aircraft. Balance reset to $10,000,000, reputation to 0.',
             'bots_reset': bot_names
         })
         
@@ -1219,98 +1444,17 @@ def reset_single_bot(bot_id):
                 'message': f'Airline {bot["name"]} is not a bot airline'
             }), 400
         
-        country_code = bot['country_code']
-        bot_name = bot['name']
-        
-        # If no country code, try to infer from name
-        if not country_code:
-            country_code = get_country_for_airline(bot_name)
-        
         # Get current cycle for airplane construction
-        cursor.execute("SELECT MAX(cycle) as current_cycle FROM cycle")
-        cycle_result = cursor.fetchone()
-        current_cycle = cycle_result['current_cycle'] if cycle_result and cycle_result['current_cycle'] else 0
-        
-        # Get cheap airplane models (price < 40,000,000)
-        cursor.execute("SELECT id, name, price, capacity FROM airplane_model WHERE price < 40000000 ORDER BY price")
-        cheap_models = cursor.fetchall()
+        current_cycle = get_current_cycle_cached(cursor)
         
-        # Delete link assignments first (foreign key)
-        cursor.execute("DELETE FROM link_assignment WHERE link IN (SELECT id FROM link WHERE airline = %s)", (bot_id,))
-        
-        # Delete link consumptions
-        cursor.execute("DELETE FROM link_consumption WHERE link IN (SELECT id FROM link WHERE airline = %s)", (bot_id,))
-        
-        # Delete links (routes)
-        cursor.execute("DELETE FROM link WHERE airline = %s", (bot_id,))
-        routes_deleted = cursor.rowcount
-        
-        # Delete airplane configurations
-        cursor.execute("DELETE FROM airplane_configuration WHERE airplane IN (SELECT id FROM airplane WHERE owner = %s)", (bot_id,))
-        
-        # Delete airplanes
-        cursor.execute("DELETE FROM airplane WHERE owner = %s", (bot_id,))
-        aircraft_deleted = cursor.rowcount
-        
-        # Delete ALL bases
-        cursor.execute("DELETE FROM airline_base WHERE airline = %s", (bot_id,))
-        bases_deleted = cursor.rowcount
-        
-        # Delete airline appeal (loyalty/awareness)
-        cursor.execute("DELETE FROM airline_appeal WHERE airline = %s", (bot_id,))
-        
-        # Reset balance to 200,000, reputation to 0, and update country_code if we have one
-        if country_code:
-            cursor.execute("""
-                UPDATE airline_info 
-                SET balance = '10000000', reputation = 0, service_quality = 50.00, country_code = %s
-                WHERE airline = %s
-            """, (country_code, bot_id))
-        else:
-            cursor.execute("""
-                UPDATE airline_info 
-                SET balance = '10000000', reputation = 0, service_quality = 50.00
-                WHERE airline = %s
-            """, (bot_id,))
-        
-        # Find the largest airport in the bot's country for HQ
-        hq_airport = None
-        if country_code:
-            cursor.execute("""
-                SELECT id FROM airport 
-                WHERE country_code = %s 
-                ORDER BY airport_size DESC, population DESC 
-                LIMIT 1
-            """, (country_code,))
-            airport_result = cursor.fetchone()
-            if airport_result:
-                hq_airport = airport_result['id']
-        
-        # Create new HQ base at scale 1
-        if hq_airport and country_code:
-            cursor.execute("""
-                INSERT INTO airline_base (airport, airline, scale, founded_cycle, headquarter, country)
-                VALUES (%s, %s, 1, %s, 1, %s)
-            """, (hq_airport, bot_id, current_cycle, country_code))
-        
-        # Add 5 random cheap airplanes
-        aircraft_added = 0
-        if cheap_models:
-            selected_models = random.sample(cheap_models, min(5, len(cheap_models)))
-            for model in selected_models:
-                cursor.execute("""
-                    INSERT INTO airplane (model, owner, constructed_cycle, purchased_cycle, 
-                                         airplane_condition, depreciation_rate, value, is_sold, 
-                                         dealer_ratio, home, purchase_rate, version)
-                    VALUES (%s, %s, %s, %s, 100.0, 0, %s, 0, 1.0, %s, 1.0, 0)
-                """, (model['id'], bot_id, current_cycle, current_cycle, model['price'], hq_airport))
-                aircraft_added += 1
+        counts = _reset_bots(cursor, [bot], current_cycle)
         
         conn.commit()
+        cache.clear()
         
         return jsonify({
             'success': True,
-            'message': f'Reset bot airline {bot["name"]}. Deleted {routes_deleted} routes, {aircraft_deleted} aircraft, {bases_deleted} bases. Created new HQ. Added {aircraft_added} new aircraft. Balance reset to $10,000,000, reputation to 0.'
+            'message': f'Reset bot airline {bot["name"]}. Deleted {counts["routes_deleted"]} routes, {counts["aircraft_deleted"]} aircraft, {counts["bases_deleted"]} bases. Created {counts["hqs_created"]} HQ. Added {counts["aircraft_added"]} new aircraft. Balance reset to $10,000,000, reputation to 0.'
         })
         
     except Exception as e:
@@ -1341,9 +1485,7 @@ def create_bot():
         conn.autocommit = False
         
         # Get current cycle
-        cursor.execute("SELECT MAX(cycle) as current_cycle FROM cycle")
-        cycle_result = cursor.fetchone()
-        current_cycle = cycle_result['current_cycle'] if cycle_result and cycle_result['current_cycle'] else 0
+        current_cycle = get_current_cycle_cached(cursor)
         
         # Find airport for HQ
         if airport_iata:
@@ -1355,16 +1497,8 @@ def create_bot():
             else:
                 return jsonify({'success': False, 'message': f'Airport {airport_iata} not found'}), 404
         else:
-            cursor.execute("""
-                SELECT id FROM airport 
-                WHERE country_code = %s 
-                ORDER BY airport_size DESC, population DESC 
-                LIMIT 1
-            """, (country_code,))
-            airport_result = cursor.fetchone()
-            if airport_result:
-                hq_airport = airport_result['id']
-            else:
+            hq_airport = _largest_airport_in(cursor, country_code)
+            if not hq_airport:
                 return jsonify({'success': False, 'message': f'No airport found in country {country_code}'}), 404
         
         # Create the airline (airline_type = 2 is bot/NON_PLAYER)
@@ -1385,23 +1519,21 @@ def create_bot():
             VALUES (%s, %s, 1, %s, 1, %s)
         """, (hq_airport, airline_id, current_cycle, country_code))
         
-        # Get cheap airplane models and add 5 random ones
-        cursor.execute("SELECT id, name, price, capacity FROM airplane_model WHERE price < 40000000 ORDER BY price")
-        cheap_models = cursor.fetchall()
-        
-        aircraft_added = 0
-        if cheap_models:
-            selected_models = random.sample(cheap_models, min(5, len(cheap_models)))
-            for model in selected_models:
-                cursor.execute("""
-                    INSERT INTO airplane (model, owner, constructed_cycle, purchased_cycle, 
-                                         airplane_condition, depreciation_rate, value, is_sold, 
-                                         dealer_ratio, home, purchase_rate, version)
-                    VALUES (%s, %s, %s, %s, 100.0, 0, %s, 0, 1.0, %s, 1.0, 0)
-                """, (model['id'], airline_id, current_cycle, current_cycle, model['price'], hq_airport))
-                aircraft_added += 1
+        # Add 5 random cheap airplanes (price < 40,000,000)
+        cursor.execute("""
+            INSERT INTO airplane (model, owner, constructed_cycle, purchased_cycle, 
+                                 airplane_condition, depreciation_rate, value, is_sold, 
+                                 dealer_ratio, home, purchase_rate, version)
+            SELECT id, %s, %s, %s, 100.0, 0, price, 0, 1.0, %s, 1.0, 0
+            FROM airplane_model
+            WHERE price < 40000000
+            ORDER BY RAND()
+            LIMIT 5
+        """, (airline_id, current_cycle, current_cycle, hq_airport))
+        aircraft_added = cursor.rowcount
         
         conn.commit()
+        cache.clear()
         
         return jsonify({
             'success': True,
@@ -1423,15 +1555,16 @@ def create_bot():
         conn.close()
 
 @app.route('/api/game/cycle')
+@cache.cached(timeout=2)
 def get_current_cycle():
     """Get the current game cycle/turn number"""
     conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
+    cursor = conn.cursor()
     
     try:
         cursor.execute("SELECT cycle FROM cycle LIMIT 1")
         result = cursor.fetchone()
-        cycle = result['cycle'] if result else 0
+        cycle = result[0] if result else 0
         
         return jsonify({
             'cycle': cycle,
@@ -0,0 +1,21 @@
+-- Indexes for the admin panel (admin-panel/app.py) lookups.
+-- link(airline), airplane(owner), airline_base(airline) and user_modifier(user) are already
+-- covered by the indexes/keys created in Meta.scala.
+
+-- /api/ip/<ip>: WHERE ip = ? ORDER BY last_update DESC
+CREATE INDEX idx_user_ip_ip_update ON user_ip(ip, last_update DESC);
+
+-- /api/users/<id>: WHERE user = ? ORDER BY last_update DESC LIMIT n
+CREATE INDEX idx_user_ip_user_update ON user_ip(user, last_update DESC);
+CREATE INDEX idx_user_uuid_user_update ON user_uuid(user, last_update DESC);
+
+-- /api/bots: GROUP BY owner, model
+CREATE INDEX idx_airplane_owner_model ON airplane(owner, model);
+
+-- /api/activity and /api/stats: range scan on last_active
+CREATE INDEX idx_user_last_active ON user(last_active);
+
+-- /api/users?search=: MATCH(user_name, email) AGAINST (... IN BOOLEAN MODE)
+ALTER TABLE user ADD FULLTEXT INDEX ft_user_name_email (user_name, email);
+
+ANALYZE TABLE user_ip, user_uuid, airplane, user;